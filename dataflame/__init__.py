@@ -0,0 +1,45 @@
+"""
+    DataFlame: Machine-Learning Oriented Dataframe Manipulation Interface for Pandas Dataframes
+    ==========
+    The public functions of the subpackages are exposed here. The subpackages (and therefore ``pandas`` and ``numpy``)
+    are only imported the first time one of their functions is accessed, so that ``import dataflame`` stays light.
+"""
+# libraries
+import importlib
+from typing import Any, List
+
+from .version import VERSION as __version__
+
+# the public functions and the module that each one of them lives in
+_LAZY_ATTRIBUTES = {
+    'interpolate_dataframe': '.interpolation.utilities',
+    'regress_to_class': '.label_based_dataframe_alteration.utilities',
+    'binary_label_regression_for_prediction': '.label_based_dataframe_alteration.utilities',
+    'multi_label_regression_for_prediction': '.label_based_dataframe_alteration.utilities',
+    'balance_dataframe_by_label_column': '.label_based_dataframe_alteration.utilities',
+    'enforce_not_found_policy': '.label_based_dataframe_alteration.utilities',
+    'map_the_labels': '.label_based_dataframe_alteration.utilities',
+    'keep_these_labels_only': '.label_based_dataframe_alteration.utilities',
+    'form_mapping_using_dictionary': '.label_based_dataframe_alteration.utilities',
+    'get_vector_given_sequence': '.label_reformatting.utilities',
+    'compute_correlations_in_dataframe': '.statistics.utilities',
+    'get_dataframe_column_layout': '.statistics.numerification',
+    'numerify_dataframe_column': '.statistics.numerification',
+    'numerify_dataframe': '.statistics.numerification',
+    'process_shards_with_prefetching': '.pipeline.utilities',
+}
+
+__all__ = sorted(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+    value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+    # caching it, so that the next accesses do not go through this function
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(list(globals()) + __all__)
@@ -1 +1,2 @@
-from .utilities import binary_label_regression_for_prediction, balance_dataframe_by_label_column, regress_to_class
+from .utilities import binary_label_regression_for_prediction, multi_label_regression_for_prediction, \
+    balance_dataframe_by_label_column, regress_to_class
@@ -12,11 +12,10 @@ __credit__ = 'erLab - University of California, Los Angeles'
 """
 
 # libraries
-from typing import List, Optional, Any, Dict
+from typing import List, Optional, Any, Dict, Union
 
 import pandas
 import numpy
-from sklearn.utils import shuffle as sklearn_shuffler
 
 
 # transition observation based on the dataframes
@@ -58,6 +57,10 @@ def binary_label_regression_for_prediction(
     This method is best used whenever we have the following problem:
     We are planning to use a sequence of feature vectors through time to predict a binary label (in case of multi-label, use one-vs-all approach to make it binary).
     This function helps with smoothing the slope from 0.0 (no tag present) to 1.0 (tag is detected).
+    For many label columns at once, see :func:`multi_label_regression_for_prediction`, which handles them in a single
+    pass. Note that it is not identical to this function: there, every row is ramped towards its nearest upcoming `1`
+    and the missing labels are filled with `label_to_assume_if_not_a_number` (here, the ramp of the earliest `1` of a
+    subject is the one that is kept and the missing labels are always filled with `0`).
 
     Parameters
     ----------
@@ -145,6 +148,118 @@ def binary_label_regression_for_prediction(
     return dataframe
 
 
+def multi_label_regression_for_prediction(
+        dataframe: pandas.DataFrame,
+        label_columns: Union[List[str], numpy.ndarray],
+        timestamp_column: str,
+        anticipation_time_window: float,
+        id_column: str,
+        number_of_classes: int = 2,
+        label_to_assume_if_not_a_number: int = 0
+) -> Union[pandas.DataFrame, numpy.ndarray]:
+    """
+    The :func:`multi_label_regression_for_prediction` is the multi-label (one-vs-all) version of
+    :func:`binary_label_regression_for_prediction`. Instead of calling that function once per label, which re-sorts
+    and re-scans the subjects every time, the rows are partitioned by subject and sorted by time only once, and the
+    ramps and class bins of all the labels are computed together as a 2-D array.
+    For every row, the nearest upcoming `1` of each label (within the anticipation time window) determines its ramp,
+    and the rows which are in no window (or have missing labels) are filled with `label_to_assume_if_not_a_number`.
+    Therefore, its outputs can differ from those of :func:`binary_label_regression_for_prediction`, in which only the
+    ramp of the earliest `1` of every subject is kept and the missing labels are always filled with `0`.
+
+    Parameters
+    ----------
+    dataframe: ``pandas.DataFrame``, required
+        This function works with a ``pandas.dataframe``. Its row order is not changed.
+    label_columns: ``Union[List[str], numpy.ndarray]``, required
+        Either the list of the label columns (each one can include `0`, `1`, or `nan` as its values), or a multi-hot
+        matrix of shape `(number of rows, number of labels)` aligned with the rows of the dataframe (for example,
+        the stacked outputs of :func:`dataflame.label_reformatting.get_vector_given_sequence`).
+    timestamp_column: ``str``, required
+        The timestamp column which can include int values or float values
+    anticipation_time_window: ``float``, required,
+        The time window of anticipation, must be in the same unit as the timestamp column in the df dataframe.
+    id_column: ``str``, required
+        In case of a machine learning dataset (like if we want to separate them by ``patient_id``) this column is used
+        to differentiate in terms of interpolation between those.
+    number_of_classes: ``int``, optional (default=2)
+        The number of unique labels that you want in the end for every label.
+    label_to_assume_if_not_a_number: ``int``, optional (default=0)
+        Fill the not a number labels in the end with this value
+
+    Returns
+    ----------
+    If `label_columns` is a list of column names, the dataframe is returned with those columns replaced by their
+    quantized ramps. If it is a matrix, the quantized ramps are returned as a ``numpy.ndarray`` of the same shape.
+    In both cases, the classes are stored with the smallest unsigned integer dtype that fits `number_of_classes`.
+    """
+
+    # verifications
+    assert number_of_classes >= 2, "invalid number of classes, the minimum value is 2."
+
+    # gathering the labels as a single matrix, one column per label
+    if isinstance(label_columns, numpy.ndarray):
+        labels = numpy.asarray(label_columns, dtype='float32')
+        assert labels.ndim == 2 and labels.shape[0] == dataframe.shape[0], \
+            "the label matrix should have one row per row of the dataframe."
+    else:
+        labels = dataframe[label_columns].to_numpy(dtype='float32')
+
+    timestamps = dataframe[timestamp_column].to_numpy(dtype='float64')
+    anticipation_time_window = float(anticipation_time_window)
+
+    # one partitioning of the subjects and one sort (by subject, then by time) is shared by all the labels
+    subject_codes, _ = pandas.factorize(dataframe[id_column])
+    order = numpy.lexsort((timestamps, subject_codes))
+    sorted_codes = subject_codes[order]
+    boundaries = numpy.flatnonzero(numpy.diff(sorted_codes)) + 1
+    starts = numpy.concatenate(([0], boundaries))
+    ends = numpy.concatenate((boundaries, [order.shape[0]]))
+
+    # rows without a subject identifier are left untouched, the rest will be overwritten by their ramps
+    ramps = labels.copy()
+    for start, end in zip(starts, ends):
+        if start == end or sorted_codes[start] < 0:
+            continue
+        rows = order[start:end]
+        subject_timestamps = timestamps[rows]
+        subject_labels = labels[rows]
+
+        # the timestamp of the nearest upcoming `1` for every row and label, found by a reversed running minimum
+        timestamps_of_ones = numpy.where(subject_labels == 1, subject_timestamps[:, None], numpy.inf)
+        next_ones = numpy.minimum.accumulate(timestamps_of_ones[::-1], axis=0)[::-1]
+
+        # rows sharing a timestamp should also share the nearest `1`
+        next_ones = next_ones[numpy.searchsorted(subject_timestamps, subject_timestamps, side='left')]
+
+        distances = next_ones - subject_timestamps[:, None]
+        with numpy.errstate(invalid='ignore'):
+            ramps[rows] = numpy.where(
+                distances <= anticipation_time_window,
+                (anticipation_time_window - distances) / anticipation_time_window,
+                numpy.nan
+            )
+
+    if label_to_assume_if_not_a_number is not None:
+        # filling the rest of the labels with "label_to_assume_if_not_a_number"
+        ramps = numpy.where(numpy.isnan(ramps), label_to_assume_if_not_a_number, ramps)
+
+    # assigning every value to the nearest bin (the lower one in case of a tie), all labels together
+    class_bins = numpy.linspace(0, 1, number_of_classes)
+    classes = numpy.searchsorted((class_bins[1:] + class_bins[:-1]) / 2.0, ramps, side='left')
+    classes[numpy.isnan(ramps)] = 0
+    classes = classes.astype(numpy.min_scalar_type(number_of_classes - 1))
+
+    if isinstance(label_columns, numpy.ndarray):
+        return classes
+
+    # writing the classes back to the label columns
+    for index, label_column in enumerate(label_columns):
+        dataframe[label_column] = classes[:, index]
+
+    return dataframe
+
+
 # balancing dataframe by a special column
 def balance_dataframe_by_label_column(
         dataframe: pandas.DataFrame,
@@ -152,7 +267,8 @@ def balance_dataframe_by_label_column(
         sample_count_per_category: Optional[int] = 1000,
         shuffle: bool = True,
         list_of_accepted_outputs: List[str] = None,
-        consider_this_number_of_frequent_labels_only: int = None
+        consider_this_number_of_frequent_labels_only: int = None,
+        random_state: Optional[int] = None
 ) -> pandas.DataFrame:
     """
     This method balances the dataframe by label column
@@ -172,6 +288,9 @@ def balance_dataframe_by_label_column(
     list_of_accepted_outputs: ``List[str]``, optional (default=`None`)
         In case only a certain set of labels is to be accepted, they will be given to this.
     consider_this_number_of_frequent_labels_only: ``int``, optional (default=`None`)
+    random_state: ``Optional[int]``, optional (default=`None`)
+        The seed used for the sampling and the shuffling, set it to get reproducible outputs. If it is left as
+        `None`, the global ``numpy`` random state is used (so ``numpy.random.seed`` can be used instead).
 
     Returns
     ----------
@@ -209,12 +328,16 @@ def balance_dataframe_by_label_column(
     # labels are to be found
     labels = list(dataframe[label_column].unique())
 
+    # the random number generator for the sampling and the shuffling (`None` means the global one of numpy)
+    random_generator = None if random_state is None else numpy.random.RandomState(random_state)
+
     # now we will find the dataframes and do the sampling with replacement
     dataframe_list = []
     for label in labels:
         if not pandas.isna(label):
             dataframe_list.append(
-                dataframe[dataframe[label_column] == label].sample(sample_count_per_category, replace=True)
+                dataframe[dataframe[label_column] == label].sample(sample_count_per_category, replace=True,
+                                                                random_state=random_generator)
             )
 
     # to conserve memory:
@@ -223,9 +346,10 @@ def balance_dataframe_by_label_column(
     # everything comes together now:
     output_dataframe = pandas.concat(dataframe_list)
 
-    # if shuffling is active, the sci-kit learn dataframe shuffler comes to play
+    # if shuffling is active, the rows are reordered by a random permutation
     if shuffle:
-        output_dataframe = sklearn_shuffler(output_dataframe)
+        permutation = (numpy.random if random_generator is None else random_generator).permutation
+        output_dataframe = output_dataframe.iloc[permutation(output_dataframe.shape[0])]
 
     # it is ready now, and will be returned.
     return output_dataframe
@@ -0,0 +1 @@
+from .utilities import process_shards_with_prefetching
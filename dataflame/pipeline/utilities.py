@@ -0,0 +1,85 @@
+__title__ = 'Project DataFlame'
+__author__ = 'Shayan Fazeli'
+__email__ = 'shayan@cs.ucla.edu'
+__credit__ = 'erLab - University of California, Los Angeles'
+
+"""
+    DataFlame: Utilities for Pipelined Processing
+    ==========
+    This module includes the utilities for processing a sequence of dataframe shards (e.g. per-day files) in a
+    producer/consumer fashion, so that reading the upcoming shards overlaps with transforming the current one.
+"""
+# libraries
+from typing import Any, Callable, Iterable, Iterator
+from collections import deque
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
+
+
+def process_shards_with_prefetching(
+        shards: Iterable[Any],
+        reader: Callable[[Any], Any],
+        processor: Callable[[Any], Any],
+        number_of_workers: int = 2,
+        prefetch_size: int = 4
+) -> Iterator[Any]:
+    """
+    The :func:`process_shards_with_prefetching` is used whenever we have a large number of shards (for example,
+    one file per day) and each one of them has to be read and then transformed (e.g. by
+    :func:`dataflame.interpolation.interpolate_dataframe` or the label alteration functions). The reading and
+    decoding of the upcoming shards takes place in a pool of threads, while the current shard is being processed
+    in the calling thread. Therefore, the overall time approaches the maximum of the I/O and compute times rather
+    than their sum.
+
+    Parameters
+    ----------
+    shards: ``Iterable[Any]``, required
+        The shard descriptors (for example, file paths) which will be handed to the `reader` one by one.
+    reader: ``Callable[[Any], Any]``, required
+        The callable which receives a shard descriptor and returns the loaded shard (e.g. ``pandas.read_csv``).
+        It is run in the worker threads.
+    processor: ``Callable[[Any], Any]``, required
+        The callable which receives a loaded shard and returns the processed output. It is run in the
+        calling thread.
+    number_of_workers: ``int``, optional (default=2)
+        The number of threads which are used for reading the shards.
+    prefetch_size: ``int``, optional (default=4)
+        The maximum number of shards that are being read (or are read and waiting to be processed) at any
+        given time. This bounds the memory usage, since the readers will not run ahead of the processing
+        by more than this number of shards.
+
+    Returns
+    ----------
+    The output of this method is an iterator over the processed outputs, in the same order as the given `shards`.
+    If the `reader` or the `processor` raises an exception for a shard, it is re-raised when that shard is reached
+    and the pending reads are cancelled.
+    """
+
+    # verifications
+    assert number_of_workers >= 1, "invalid number of workers, the minimum value is 1."
+    assert prefetch_size >= 1, "invalid prefetch size, the minimum value is 1."
+
+    shards = iter(shards)
+
+    # the futures of the shards that are being read, kept in the original order
+    pending = deque()
+
+    with ThreadPoolExecutor(max_workers=number_of_workers) as executor:
+        try:
+            # filling the queue for the first time
+            for shard in islice(shards, prefetch_size):
+                pending.append(executor.submit(reader, shard))
+
+            while pending:
+                # waiting for the oldest shard to be read (errors of the reader are raised here)
+                loaded_shard = pending.popleft().result()
+
+                # there is room in the queue now, so the next read is scheduled before the processing starts
+                for shard in islice(shards, 1):
+                    pending.append(executor.submit(reader, shard))
+
+                yield processor(loaded_shard)
+        finally:
+            # in case of an error (or if the consumer stops early) the reads which are not started yet are dropped
+            for future in pending:
+                future.cancel()
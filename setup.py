@@ -12,16 +12,15 @@ setup(
           'Intended Audience :: Science/Research',
           #'Development Status :: 1 - Beta',
           'License :: OSI Approved :: Apache Software License',
-          'Programming Language :: Python :: 3.6',
+          'Programming Language :: Python :: 3.7',
           'Topic :: Scientific/Engineering :: Artificial Intelligence'
       ],
     keywords="dataflame machine learning dataframe label interpolation",
     packages=find_packages(),
-    python_requires='>3.6.0',
+    python_requires='>=3.7',
     install_requires=[
         'numpy',
-        'pandas',
-        'sklearn'
+        'pandas'
     ],
     zip_safe=False
 )
\ No newline at end of file
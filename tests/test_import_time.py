@@ -0,0 +1,60 @@
+"""
+    DataFlame: Tests for the Top-Level Import
+    ==========
+    These tests guard the startup budget of ``import dataflame``, and check that the lazily loaded top-level
+    namespace stays in sync with the subpackages.
+"""
+# libraries
+import importlib
+import subprocess
+import sys
+import unittest
+
+import dataflame
+
+# the cumulative import time of `dataflame` (in microseconds) that we do not want to exceed
+IMPORT_TIME_BUDGET_IN_MICROSECONDS = 100000
+
+# the modules that should not be imported by `import dataflame`
+HEAVY_MODULES = ['pandas', 'numpy', 'sklearn']
+
+
+def run_in_fresh_interpreter(*arguments: str) -> subprocess.CompletedProcess:
+    return subprocess.run([sys.executable] + list(arguments), capture_output=True, text=True, check=True)
+
+
+class TestImportTime(unittest.TestCase):
+    def test_heavy_modules_are_not_imported(self):
+        output = run_in_fresh_interpreter(
+            '-c',
+            'import sys, dataflame; print(",".join(m for m in {} if m in sys.modules))'.format(HEAVY_MODULES)
+        )
+        self.assertEqual(output.stdout.strip(), '', "heavy modules imported by `import dataflame`")
+
+    def test_import_time_budget(self):
+        output = run_in_fresh_interpreter('-X', 'importtime', '-c', 'import dataflame')
+        # lines are formatted as "import time: self | cumulative | name"
+        cumulative_times = [
+            int(line.split('|')[1])
+            for line in output.stderr.splitlines()
+            if line.startswith('import time:') and line.split('|')[-1].strip() == 'dataflame'
+        ]
+        self.assertEqual(len(cumulative_times), 1)
+        self.assertLessEqual(cumulative_times[0], IMPORT_TIME_BUDGET_IN_MICROSECONDS)
+
+    def test_every_public_name_resolves(self):
+        for name in dataflame.__all__:
+            self.assertTrue(callable(getattr(dataflame, name)), name)
+
+    def test_subpackage_exports_are_exposed(self):
+        for subpackage_name in ['interpolation', 'label_based_dataframe_alteration', 'label_reformatting',
+                                'statistics', 'pipeline']:
+            subpackage = importlib.import_module('dataflame.' + subpackage_name)
+            for name, value in vars(subpackage).items():
+                if callable(value) and getattr(value, '__module__', '').startswith('dataflame.'):
+                    self.assertIn(name, dataflame.__all__, "dataflame.{} is not exposed".format(name))
+                    self.assertIs(getattr(dataflame, name), value)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,129 @@
+"""
+    DataFlame: Tests for the Label Based Dataframe Alteration
+    ==========
+    These tests check the behaviour of :func:`multi_label_regression_for_prediction` and the reproducibility
+    of :func:`balance_dataframe_by_label_column`.
+"""
+# libraries
+import unittest
+
+import numpy
+import pandas
+
+from dataflame.label_based_dataframe_alteration import multi_label_regression_for_prediction, \
+    balance_dataframe_by_label_column
+
+
+class TestMultiLabelRegressionForPrediction(unittest.TestCase):
+    def test_ramp_towards_nearest_upcoming_one(self):
+        # the rows are given out of time order, label `a` has two ones and label `b` has one
+        dataframe = pandas.DataFrame({
+            'id': [1, 1, 1, 1, 1, 1],
+            'time': [6, 1, 2, 3, 4, 5],
+            'a': [1, 0, 0, 1, 0, 0],
+            'b': [0, 0, 0, 0, 0, 1],
+        })
+        output = multi_label_regression_for_prediction(
+            dataframe, ['a', 'b'], 'time', anticipation_time_window=2, id_column='id', number_of_classes=3)
+
+        # for `a`, time 2 is ramped towards the one at 3, and time 5 towards the one at 6 (not the earlier one)
+        self.assertEqual(output['a'].tolist(), [2, 0, 1, 2, 0, 1])
+        self.assertEqual(output['b'].tolist(), [0, 0, 0, 0, 1, 2])
+        self.assertEqual(output['time'].tolist(), [6, 1, 2, 3, 4, 5])
+
+    def test_subjects_are_ramped_separately(self):
+        dataframe = pandas.DataFrame({
+            'id': ['x', 'y', 'x', 'y'],
+            'time': [1, 1, 2, 2],
+            'a': [0, 0, 1, 0],
+        })
+        output = multi_label_regression_for_prediction(
+            dataframe, ['a'], 'time', anticipation_time_window=1, id_column='id')
+        self.assertEqual(output['a'].tolist(), [0, 0, 1, 0])
+
+    def test_rows_sharing_a_timestamp_share_the_ramp(self):
+        # the one is not the first row among the rows at time 2
+        dataframe = pandas.DataFrame({
+            'id': [1, 1, 1, 1],
+            'time': [1, 2, 2, 2],
+            'a': [0, 0, 0, 1],
+        })
+        output = multi_label_regression_for_prediction(
+            dataframe, ['a'], 'time', anticipation_time_window=2, id_column='id', number_of_classes=5)
+        self.assertEqual(output['a'].tolist(), [2, 4, 4, 4])
+
+    def test_rows_without_identifier_keep_their_raw_label(self):
+        dataframe = pandas.DataFrame({
+            'id': [1.0, 1.0, numpy.nan, numpy.nan],
+            'time': [1, 2, 1, 2],
+            'a': [0, 1, 1, 0],
+        })
+        output = multi_label_regression_for_prediction(
+            dataframe, ['a'], 'time', anticipation_time_window=10, id_column='id', number_of_classes=3)
+        self.assertEqual(output['a'].tolist(), [2, 2, 2, 0])
+
+    def test_multi_hot_matrix_input(self):
+        dataframe = pandas.DataFrame({'id': [1, 1, 1], 'time': [1, 2, 3]})
+        labels = numpy.array([
+            [0, 0, 0],
+            [0, 1, 0],
+            [1, 0, 0],
+        ])
+        output = multi_label_regression_for_prediction(
+            dataframe, labels, 'time', anticipation_time_window=2, id_column='id', number_of_classes=3)
+
+        self.assertIsInstance(output, numpy.ndarray)
+        self.assertEqual(output.shape, labels.shape)
+        numpy.testing.assert_array_equal(output, [[0, 1, 0], [1, 2, 0], [2, 0, 0]])
+        self.assertEqual(dataframe.columns.tolist(), ['id', 'time'])
+
+    def test_compact_integer_dtype(self):
+        dataframe = pandas.DataFrame({'id': [1, 1], 'time': [1, 2], 'a': [0, 1]})
+        for number_of_classes, dtype in [(2, numpy.uint8), (256, numpy.uint8), (300, numpy.uint16)]:
+            output = multi_label_regression_for_prediction(
+                dataframe.copy(), ['a'], 'time', anticipation_time_window=1, id_column='id',
+                number_of_classes=number_of_classes)
+            self.assertEqual(output['a'].dtype, dtype)
+            self.assertEqual(output['a'].tolist(), [0, number_of_classes - 1])
+
+    def test_rows_outside_every_window_are_filled(self):
+        dataframe = pandas.DataFrame({
+            'id': [1, 1, 1, 1],
+            'time': [1, 2, 3, 4],
+            'a': [numpy.nan, 0, 0, 1],
+        })
+        # time 1 is outside the window of the one at time 4, time 2 is at its start
+        output = multi_label_regression_for_prediction(
+            dataframe.copy(), ['a'], 'time', anticipation_time_window=2, id_column='id', number_of_classes=5,
+            label_to_assume_if_not_a_number=1)
+        self.assertEqual(output['a'].tolist(), [4, 0, 2, 4])
+
+        output = multi_label_regression_for_prediction(
+            dataframe.copy(), ['a'], 'time', anticipation_time_window=2, id_column='id', number_of_classes=5)
+        self.assertEqual(output['a'].tolist(), [0, 0, 2, 4])
+
+
+
+class TestBalanceDataframeByLabelColumn(unittest.TestCase):
+    def setUp(self):
+        self.dataframe = pandas.DataFrame({
+            'label': [0] * 10 + [1] * 3 + [2] * 5,
+            'value': list(range(18)),
+        })
+
+    def test_explicit_random_state_is_reproducible(self):
+        first = balance_dataframe_by_label_column(self.dataframe, 'label', random_state=7)
+        second = balance_dataframe_by_label_column(self.dataframe, 'label', random_state=7)
+        pandas.testing.assert_frame_equal(first, second)
+        self.assertEqual(first['label'].value_counts().tolist(), [10, 10, 10])
+
+    def test_global_numpy_seed_is_reproducible(self):
+        numpy.random.seed(0)
+        first = balance_dataframe_by_label_column(self.dataframe, 'label')
+        numpy.random.seed(0)
+        second = balance_dataframe_by_label_column(self.dataframe, 'label')
+        pandas.testing.assert_frame_equal(first, second)
+
+
+if __name__ == '__main__':
+    unittest.main()
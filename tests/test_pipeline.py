@@ -0,0 +1,94 @@
+"""
+    DataFlame: Tests for the Pipelined Processing
+    ==========
+    These tests check the ordering, the backpressure and the error handling of
+    :func:`dataflame.pipeline.process_shards_with_prefetching`.
+"""
+# libraries
+import threading
+import time
+import unittest
+
+from dataflame.pipeline import process_shards_with_prefetching
+
+
+class TestProcessShardsWithPrefetching(unittest.TestCase):
+    def test_outputs_are_in_input_order(self):
+        # the earlier shards take longer to be read, so the reads finish out of order
+        def reader(shard):
+            time.sleep(0.02 * (5 - shard))
+            return shard
+
+        outputs = list(process_shards_with_prefetching(
+            range(5), reader, lambda x: x * 10, number_of_workers=5, prefetch_size=5))
+        self.assertEqual(outputs, [0, 10, 20, 30, 40])
+
+    def test_prefetch_is_bounded(self):
+        lock = threading.Lock()
+        state = {'running': 0, 'maximum_running': 0}
+
+        # there are more workers than the prefetch size, so only the prefetch size can bound the running reads
+        def reader(shard):
+            with lock:
+                state['running'] += 1
+                state['maximum_running'] = max(state['maximum_running'], state['running'])
+            time.sleep(0.02)
+            with lock:
+                state['running'] -= 1
+            return shard
+
+        outputs = list(process_shards_with_prefetching(
+            range(20), reader, lambda x: x, number_of_workers=8, prefetch_size=3))
+        self.assertEqual(outputs, list(range(20)))
+        self.assertEqual(state['maximum_running'], 3)
+
+    def test_reader_exception_is_raised_at_the_failing_shard(self):
+        def reader(shard):
+            if shard == 3:
+                raise ValueError("cannot read shard 3")
+            return shard
+
+        outputs = []
+        with self.assertRaisesRegex(ValueError, "cannot read shard 3"):
+            for output in process_shards_with_prefetching(range(10), reader, lambda x: x):
+                outputs.append(output)
+        self.assertEqual(outputs, [0, 1, 2])
+
+    def test_processor_exception_cancels_pending_reads(self):
+        read_shards = []
+
+        def reader(shard):
+            read_shards.append(shard)
+            time.sleep(0.1)
+            return shard
+
+        def processor(shard):
+            raise RuntimeError("cannot process shard {}".format(shard))
+
+        with self.assertRaisesRegex(RuntimeError, "cannot process shard 0"):
+            list(process_shards_with_prefetching(
+                range(10), reader, processor, number_of_workers=1, prefetch_size=4))
+
+        # shard 1 may have started before the error, the queued shards 2 to 4 are cancelled
+        self.assertTrue(set(read_shards) <= {0, 1})
+
+    def test_close_shuts_the_pool_down(self):
+        threads_before = set(threading.enumerate())
+        read_shards = []
+
+        def reader(shard):
+            read_shards.append(shard)
+            time.sleep(0.05)
+            return shard
+
+        generator = process_shards_with_prefetching(
+            range(100), reader, lambda x: x, number_of_workers=1, prefetch_size=4)
+        self.assertEqual(next(generator), 0)
+        generator.close()
+
+        self.assertLess(len(read_shards), 100)
+        self.assertEqual(set(threading.enumerate()) - threads_before, set())
+
+
+if __name__ == '__main__':
+    unittest.main()